@@ -57,6 +57,10 @@ class Config:
     EMAIL_USE_TLS = os.environ.get('EMAIL_USE_TLS', 'True').lower() == 'true'
     EMAIL_FROM = os.environ.get('EMAIL_FROM', os.environ.get('EMAIL_USERNAME', ''))
     
+    # Real-time: opt-in MessagePack wire format for Socket.IO (requires `msgpack`
+    # on the server and the socket.io.msgpack client bundle, served by the templates)
+    SOCKETIO_MSGPACK = os.environ.get('SOCKETIO_MSGPACK', 'False').lower() == 'true'
+    
     # Webhook
     WEBHOOK_URL = os.environ.get(
         'WEBHOOK_URL', 
@@ -146,3 +150,4 @@ EMAIL_USERNAME = Config.EMAIL_USERNAME
 EMAIL_PASSWORD = Config.EMAIL_PASSWORD
 EMAIL_USE_TLS = Config.EMAIL_USE_TLS
 EMAIL_FROM = Config.EMAIL_FROM
+SOCKETIO_MSGPACK = Config.SOCKETIO_MSGPACK
@@ -100,6 +100,7 @@ def restore_user_session():
                     session['member_id'] = str(user['_id'])
                     session['member_name'] = user.get('name', 'Unknown')
                     session['member_role'] = user.get('role', 'Member')
+                    cache_socket_rooms()
                     session.permanent = True
                     session.modified = True
                     
@@ -224,6 +225,34 @@ def is_tech_director():
     return role == 'Technical Director'
 
 
+def role_room_name(role):
+    """
+    Build the Socket.IO room name for a role.
+    
+    Args:
+        role: Role name (spaces are normalized to underscores)
+        
+    Returns:
+        str: Room name, e.g. 'role_Technical_Director'
+    """
+    return f'role_{role.replace(" ", "_")}'
+
+
+def cache_socket_rooms():
+    """
+    Precompute the user/role Socket.IO room names for the current session.
+    
+    PERFORMANCE: Room names are derived once at login/restore instead of
+    being rebuilt on every join_user_room / join_role_room event.
+    """
+    member_id = session.get('member_id')
+    role = session.get('member_role')
+    if member_id:
+        session['member_user_room'] = f'user_{member_id}'
+    if role:
+        session['member_role_room'] = role_room_name(role)
+
+
 def clear_session():
     """Clear all session data for logout."""
     session.clear()
@@ -241,5 +270,6 @@ def init_session(user):
     session['user_id'] = user.get('user_id')
     session['member_name'] = user.get('name', 'Unknown')
     session['member_role'] = user.get('role', 'Member')
+    cache_socket_rooms()
     session['_login_time'] = datetime.now().isoformat()
     session.modified = True
@@ -15,7 +15,7 @@ import json
 from datetime import datetime
 from flask import Blueprint, jsonify, request
 
-from utils.file_utils import detect_warranty_form, save_ticket_attachment_to_disk, get_attachment_signature
+from utils.file_utils import detect_warranty_form, save_ticket_attachments_to_disk, get_attachment_signature
 from utils.validators import extract_email
 from config.settings import Config
 
@@ -254,7 +254,8 @@ def process_n8n_email_data(raw_data):
         has_warranty = False
         upload_root = Config.get_upload_folder()
         
-        for idx, att in enumerate(raw_attachments):
+        unique_attachments = []
+        for att in raw_attachments:
             if not isinstance(att, dict):
                 continue
             
@@ -268,8 +269,12 @@ def process_n8n_email_data(raw_data):
             fn = att.get('filename') or att.get('fileName') or att.get('name') or 'attachment'
             if detect_warranty_form(fn):
                 has_warranty = True
-            # Persist to filesystem and store only metadata in ticket (production-safe)
-            persisted = save_ticket_attachment_to_disk(ticket_id, att, idx, upload_root)
+            unique_attachments.append(att)
+        
+        # Persist to filesystem in one batch and store only metadata in ticket (production-safe)
+        persisted_list = save_ticket_attachments_to_disk(ticket_id, unique_attachments, upload_root)
+        for att, persisted in zip(unique_attachments, persisted_list):
+            fn = att.get('filename') or att.get('fileName') or att.get('name') or 'attachment'
             if persisted:
                 attachments.append(persisted)
             else:
@@ -14,6 +14,7 @@ import base64
 import logging
 import smtplib
 import mimetypes
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
@@ -37,6 +38,22 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# PERFORMANCE: Extensions seen in ticket mail - resolved without touching the
+# mimetypes database; anything else falls back to mimetypes.guess_type
+_COMMON_MIMES = {
+    'pdf': 'application/pdf',
+    'png': 'image/png',
+    'jpg': 'image/jpeg',
+    'jpeg': 'image/jpeg',
+    'gif': 'image/gif',
+    'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    'zip': 'application/zip',
+    'txt': 'text/plain',
+    'csv': 'text/csv',
+    'log': 'text/plain',
+}
+
 
 class EmailService:
     """Email service for sending notifications with attachment support."""
@@ -60,10 +77,12 @@ class EmailService:
         self.password = password or EMAIL_PASSWORD
         self.use_tls = use_tls if use_tls is not None else EMAIL_USE_TLS
         self.from_email = from_email or EMAIL_FROM
+        # Credentials don't change at runtime - evaluate once
+        self._configured = bool(self.username and self.password)
     
     def is_configured(self):
         """Check if email service is properly configured."""
-        return bool(self.username and self.password)
+        return self._configured
     
     def send_email(self, to_email, subject, body, html_body=None, attachments=None):
         """
@@ -83,7 +102,7 @@ class EmailService:
         """
         try:
             # Skip sending if email is not configured
-            if not self.is_configured():
+            if not self._configured:
                 logger.warning("Email not configured - would send email:")
                 logger.info(f"To: {to_email}")
                 logger.info(f"Subject: {subject}")
@@ -92,26 +111,38 @@ class EmailService:
                     logger.info(f"Attachments: {len(attachments)} files")
                 return True  # Return True to not break workflow
             
-            # Create message
-            msg = MIMEMultipart('alternative')
+            # Create message - PERFORMANCE: only wrap in multipart when needed
+            # (plain-text notifications are the common case)
+            if not html_body and not attachments:
+                msg = MIMEText(body, 'plain')
+            elif not attachments:
+                msg = MIMEMultipart('alternative')
+                msg.attach(MIMEText(body, 'plain'))
+                msg.attach(MIMEText(html_body, 'html'))
+            else:
+                msg = MIMEMultipart('mixed')
+                if html_body:
+                    body_part = MIMEMultipart('alternative')
+                    body_part.attach(MIMEText(body, 'plain'))
+                    body_part.attach(MIMEText(html_body, 'html'))
+                    msg.attach(body_part)
+                else:
+                    msg.attach(MIMEText(body, 'plain'))
+
+                # PERFORMANCE: encode multiple attachments in parallel, attach in order
+                if len(attachments) > 1:
+                    with ThreadPoolExecutor(max_workers=min(4, len(attachments))) as executor:
+                        parts = list(executor.map(self._encode_attachment, attachments))
+                else:
+                    parts = [self._encode_attachment(attachments[0])]
+                for part in parts:
+                    if part is not None:
+                        msg.attach(part)
+
             msg['From'] = self.from_email
             msg['To'] = to_email if isinstance(to_email, str) else ', '.join(to_email)
             msg['Subject'] = subject
-            
-            # Add text body
-            text_part = MIMEText(body, 'plain')
-            msg.attach(text_part)
-            
-            # Add HTML body if provided
-            if html_body:
-                html_part = MIMEText(html_body, 'html')
-                msg.attach(html_part)
-            
-            # Add attachments if provided
-            if attachments:
-                for attachment in attachments:
-                    self._add_attachment(msg, attachment)
-            
+
             # Send email
             recipients = [to_email] if isinstance(to_email, str) else to_email
             
@@ -128,32 +159,35 @@ class EmailService:
             logger.error(f"Failed to send email to {to_email}: {e}")
             return False
     
-    def _add_attachment(self, msg, attachment):
+    def _encode_attachment(self, attachment):
         """
-        Add an attachment to the message.
+        Encode an attachment into a detached MIME part.
         
         Args:
-            msg: MIMEMultipart message
             attachment: File path string or dict with file data
+            
+        Returns:
+            MIMEBase: Encoded part, or None if the attachment was skipped
         """
         try:
             if isinstance(attachment, str):
                 # Handle file path attachment
-                self._add_file_attachment(msg, attachment)
+                return self._encode_file_attachment(attachment)
             elif isinstance(attachment, dict):
                 # Handle base64 data attachment
-                self._add_base64_attachment(msg, attachment)
+                return self._encode_base64_attachment(attachment)
             else:
                 logger.warning(f"Invalid attachment format: {type(attachment)}")
                 
         except Exception as e:
             logger.error(f"Error processing attachment: {e}")
+        return None
     
-    def _add_file_attachment(self, msg, file_path):
-        """Add attachment from file path."""
+    def _encode_file_attachment(self, file_path):
+        """Build attachment part from file path."""
         if not os.path.exists(file_path):
             logger.warning(f"Attachment file not found: {file_path}")
-            return
+            return None
         
         with open(file_path, 'rb') as f:
             part = MIMEBase('application', 'octet-stream')
@@ -162,27 +196,37 @@ class EmailService:
         encoders.encode_base64(part)
         filename = os.path.basename(file_path)
         part.add_header('Content-Disposition', f'attachment; filename="{filename}"')
-        msg.attach(part)
         logger.debug(f"Added file attachment: {filename}")
+        return part
     
-    def _add_base64_attachment(self, msg, attachment):
-        """Add attachment from base64 data."""
+    def _encode_base64_attachment(self, attachment):
+        """Build attachment part from base64 data."""
         filename = attachment.get('filename', attachment.get('fileName', 'attachment'))
         file_data = attachment.get('data', attachment.get('fileData', ''))
         content_type = attachment.get('content_type', 'application/octet-stream')
         
         if not file_data:
             logger.warning(f"No data provided for attachment: {filename}")
-            return
+            return None
         
         try:
+            # Data-URI form ("data:image/png;base64,iVBOR...") - split once at the
+            # comma, take the MIME type from the header and decode only the payload.
+            # bytes payloads go straight to b64decode as before.
+            if isinstance(file_data, str) and file_data.startswith('data:'):
+                header, _, file_data = file_data.partition(',')
+                uri_type = header[5:].split(';', 1)[0]
+                if uri_type and content_type == 'application/octet-stream':
+                    content_type = uri_type
+
             # Decode base64 data
             decoded_data = base64.b64decode(file_data)
             
             # Determine MIME type
             mime_type = content_type
             if mime_type == 'application/octet-stream':
-                guessed_type, _ = mimetypes.guess_type(filename)
+                _, dot, ext = filename.rpartition('.')
+                guessed_type = (dot and _COMMON_MIMES.get(ext.lower())) or mimetypes.guess_type(filename)[0]
                 if guessed_type:
                     mime_type = guessed_type
             
@@ -192,11 +236,12 @@ class EmailService:
             part.set_payload(decoded_data)
             encoders.encode_base64(part)
             part.add_header('Content-Disposition', f'attachment; filename="{filename}"')
-            msg.attach(part)
             logger.debug(f"Added base64 attachment: {filename} ({len(decoded_data)} bytes)")
+            return part
             
         except Exception as e:
             logger.error(f"Failed to decode base64 attachment {filename}: {e}")
+            return None
     
     def send_template_email(self, to_email, template_name, context, attachments=None):
         """
@@ -19,7 +19,7 @@ from flask import session
 from flask_socketio import SocketIO, emit, join_room, leave_room
 # from flask_login import current_user # Removed dependency on flask_login
 
-from middleware.session_manager import is_authenticated
+from middleware.session_manager import is_authenticated, role_room_name
 
 logger = logging.getLogger(__name__)
 
@@ -40,14 +40,28 @@ def init_socketio(app):
         async_mode = 'threading'
     else:
         async_mode = 'eventlet'
+
+    # PERFORMANCE: Optional MessagePack serializer - small, high-volume events
+    # (status/priority shims) go out as compact binary frames instead of JSON text.
+    # Templates switch to the socket.io.msgpack client bundle via `socketio_msgpack`.
+    serializer = 'default'
+    if app.config.get('SOCKETIO_MSGPACK'):
+        try:
+            import msgpack  # noqa: F401
+            serializer = 'msgpack'
+        except ImportError:
+            logger.warning("[SOCKETIO] SOCKETIO_MSGPACK set but msgpack is not installed - using JSON")
+    app.jinja_env.globals['socketio_msgpack'] = serializer == 'msgpack'
+
     socketio.init_app(
         app,
         cors_allowed_origins="*",
         async_mode=async_mode,
+        serializer=serializer,
         logger=False,
         engineio_logger=False
     )
-    logger.info("[SOCKETIO] Initialized with %s async mode", async_mode)
+    logger.info("[SOCKETIO] Initialized with %s async mode (%s serializer)", async_mode, serializer)
     return socketio
 
 
@@ -119,7 +133,8 @@ def handle_join_user_room(data=None):
     
     member_id = session.get('member_id') or (data.get('user_id') if data else None)
     if member_id:
-        room_name = f'user_{str(member_id)}'
+        # Room name is precomputed at login (see cache_socket_rooms)
+        room_name = session.get('member_user_room') or f'user_{str(member_id)}'
         join_room(room_name)
         logger.info(f"[SOCKETIO] Client joined user room: {room_name}")
         emit('joined_user_room', {'room': room_name, 'user_id': str(member_id)})
@@ -135,8 +150,8 @@ def handle_join_role_room(data=None):
     
     role = session.get('member_role') or (data.get('role') if data else None)
     if role:
-        # Normalize role name for room (replace spaces with underscores)
-        room_name = f'role_{role.replace(" ", "_")}'
+        # Room name is precomputed at login; fall back for older sessions / explicit role
+        room_name = session.get('member_role_room') or role_room_name(role)
         join_room(room_name)
         logger.info(f"[SOCKETIO] Client joined role room: {room_name}")
         emit('joined_role_room', {'room': room_name, 'role': role})
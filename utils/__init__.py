@@ -2,4 +2,4 @@
 from utils.validators import sanitize_input, validate_email, validate_ticket_id
 from utils.file_utils import allowed_file, get_enhanced_file_type_info, format_file_size, get_mime_type
 from utils.date_utils import safe_datetime_parse, safe_date_format, group_tickets_by_date
-from utils.cache import cache_get, cache_set, rate_limit_check
+from utils.cache import cache_get, cache_set, cache_get_many, cache_set_many, rate_limit_check
@@ -8,17 +8,33 @@ Author: AutoAssistGroup Development Team
 """
 
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from threading import Lock
 
 
+# PERFORMANCE: Storage is split into shards, each with its own lock, so
+# concurrent workers touching different keys don't serialize on one lock
+_N_SHARDS = 16  # must be a power of two
+
 # Thread-safe locks for cache operations
-_cache_lock = Lock()
-_rate_limit_lock = Lock()
+_cache_locks = [Lock() for _ in range(_N_SHARDS)]
+_rate_limit_locks = [Lock() for _ in range(_N_SHARDS)]
 
 # In-memory storage
-_cache_storage = {}
-_rate_limit_storage = defaultdict(list)
+_cache_shards = [{} for _ in range(_N_SHARDS)]
+_rate_limit_shards = [defaultdict(deque) for _ in range(_N_SHARDS)]
+
+
+# Expired entries are only evicted on read; a shard that grows past the
+# threshold is swept on write, at most once per interval
+_SWEEP_INTERVAL = 30  # seconds
+_SWEEP_THRESHOLD = 1024 // _N_SHARDS
+_cache_last_sweep = [0.0] * _N_SHARDS
+
+
+def _shard(key):
+    """Return the shard index for a key."""
+    return hash(key) & (_N_SHARDS - 1)
 
 
 def cache_get(key, default=None):
@@ -32,14 +48,16 @@ def cache_get(key, default=None):
     Returns:
         Cached value or default
     """
-    with _cache_lock:
-        if key in _cache_storage:
-            value, expires = _cache_storage[key]
+    shard = _shard(key)
+    storage = _cache_shards[shard]
+    with _cache_locks[shard]:
+        if key in storage:
+            value, expires = storage[key]
             if time.time() < expires:
                 return value
             else:
                 # Clean up expired entry
-                del _cache_storage[key]
+                del storage[key]
         
         return default
 
@@ -53,9 +71,85 @@ def cache_set(key, value, expires_in=300):
         value: Value to cache
         expires_in: Time to live in seconds (default 5 minutes)
     """
-    with _cache_lock:
-        expires_at = time.time() + expires_in
-        _cache_storage[key] = (value, expires_at)
+    shard = _shard(key)
+    storage = _cache_shards[shard]
+    with _cache_locks[shard]:
+        now = time.time()
+        storage[key] = (value, now + expires_in)
+        if len(storage) > _SWEEP_THRESHOLD and now - _cache_last_sweep[shard] > _SWEEP_INTERVAL:
+            _sweep_expired(shard, now)
+
+
+def _sweep_expired(shard, now):
+    """
+    Purge expired entries from a cache shard.
+    
+    Caller must hold the shard's lock.
+    
+    Args:
+        shard: Shard index
+        now: Current time (epoch seconds)
+    """
+    storage = _cache_shards[shard]
+    expired = [k for k, (_, expires) in storage.items() if expires <= now]
+    for k in expired:
+        del storage[k]
+    _cache_last_sweep[shard] = now
+
+
+def cache_get_many(keys, default=None):
+    """
+    Get several values from cache, locking each shard once per batch.
+    
+    Args:
+        keys: Iterable of cache keys
+        default: Default value for keys not found or expired
+        
+    Returns:
+        dict: Mapping of each key to its cached value or default
+    """
+    by_shard = defaultdict(list)
+    for key in keys:
+        by_shard[_shard(key)].append(key)
+    
+    result = {}
+    now = time.time()
+    for shard, shard_keys in by_shard.items():
+        storage = _cache_shards[shard]
+        with _cache_locks[shard]:
+            for key in shard_keys:
+                entry = storage.get(key)
+                if entry is not None and now < entry[1]:
+                    result[key] = entry[0]
+                else:
+                    if entry is not None:
+                        # Clean up expired entry
+                        del storage[key]
+                    result[key] = default
+    return result
+
+
+def cache_set_many(items, expires_in=300):
+    """
+    Set several values in cache, locking each shard once per batch.
+    
+    Args:
+        items: Mapping of cache key to value
+        expires_in: Time to live in seconds (default 5 minutes)
+    """
+    by_shard = defaultdict(list)
+    for key, value in items.items():
+        by_shard[_shard(key)].append((key, value))
+    
+    for shard, entries in by_shard.items():
+        storage = _cache_shards[shard]
+        with _cache_locks[shard]:
+            now = time.time()
+            expires_at = now + expires_in
+            for key, value in entries:
+                storage[key] = (value, expires_at)
+            if len(storage) > _SWEEP_THRESHOLD and now - _cache_last_sweep[shard] > _SWEEP_INTERVAL:
+                _sweep_expired(shard, now)
 
 
 def cache_delete(key):
@@ -68,17 +162,20 @@ def cache_delete(key):
     Returns:
         bool: True if key was deleted, False if not found
     """
-    with _cache_lock:
-        if key in _cache_storage:
-            del _cache_storage[key]
+    shard = _shard(key)
+    storage = _cache_shards[shard]
+    with _cache_locks[shard]:
+        if key in storage:
+            del storage[key]
             return True
         return False
 
 
 def cache_clear():
     """Clear all cached values."""
-    with _cache_lock:
-        _cache_storage.clear()
+    for lock, storage in zip(_cache_locks, _cache_shards):
+        with lock:
+            storage.clear()
 
 
 def rate_limit_check(key, limit=10, window=60):
@@ -97,19 +194,19 @@ def rate_limit_check(key, limit=10, window=60):
     """
     current_time = time.time()
     
-    with _rate_limit_lock:
-        # Remove old entries outside the window
-        _rate_limit_storage[key] = [
-            timestamp for timestamp in _rate_limit_storage[key]
-            if current_time - timestamp < window
-        ]
+    shard = _shard(key)
+    with _rate_limit_locks[shard]:
+        # Remove old entries outside the window (timestamps are in arrival order)
+        timestamps = _rate_limit_shards[shard][key]
+        while timestamps and current_time - timestamps[0] >= window:
+            timestamps.popleft()
         
         # Check if limit exceeded
-        if len(_rate_limit_storage[key]) >= limit:
+        if len(timestamps) >= limit:
             return False
         
         # Add current request timestamp
-        _rate_limit_storage[key].append(current_time)
+        timestamps.append(current_time)
         return True
 
 
@@ -127,14 +224,17 @@ def rate_limit_remaining(key, limit=10, window=60):
     """
     current_time = time.time()
     
-    with _rate_limit_lock:
-        # Count requests in current window
-        recent_requests = [
-            timestamp for timestamp in _rate_limit_storage.get(key, [])
-            if current_time - timestamp < window
-        ]
+    shard = _shard(key)
+    with _rate_limit_locks[shard]:
+        timestamps = _rate_limit_shards[shard].get(key)
+        if not timestamps:
+            return limit
+        
+        # Prune expired entries, then count requests in current window
+        while timestamps and current_time - timestamps[0] >= window:
+            timestamps.popleft()
         
-        return max(0, limit - len(recent_requests))
+        return max(0, limit - len(timestamps))
 
 
 def rate_limit_reset(key):
@@ -144,6 +244,8 @@ def rate_limit_reset(key):
     Args:
         key: Identifier to reset
     """
-    with _rate_limit_lock:
-        if key in _rate_limit_storage:
-            del _rate_limit_storage[key]
+    shard = _shard(key)
+    storage = _rate_limit_shards[shard]
+    with _rate_limit_locks[shard]:
+        if key in storage:
+            del storage[key]
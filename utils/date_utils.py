@@ -9,11 +9,46 @@ Provides date handling helpers for:
 Author: AutoAssistGroup Development Team
 """
 
-from datetime import datetime, timedelta
-import pytz
+from bisect import bisect_right
+from datetime import datetime, time, timedelta
+from functools import lru_cache
+from time import monotonic
+from zoneinfo import ZoneInfo
 
 # British timezone (handles BST/GMT automatically)
-BRITISH_TZ = pytz.timezone('Europe/London')
+BRITISH_TZ = ZoneInfo('Europe/London')
+UTC = ZoneInfo('UTC')
+
+# Naive datetimes are UTC; used to get their epoch seconds without tz conversion
+_EPOCH = datetime(1970, 1, 1)
+
+# get_relative_time: upper bound (seconds) of each bucket, and the
+# (divisor, unit) used for the bucket above it
+_RELATIVE_THRESHOLDS = (60, 3600, 86400, 604800, 2592000)
+_RELATIVE_UNITS = (
+    (60, 'minute'),
+    (3600, 'hour'),
+    (86400, 'day'),
+    (604800, 'week'),
+    (2592000, 'month'),
+)
+
+# Cached "now" for get_relative_time when formatting many timestamps in a row
+_NOW_CACHE_TTL = 0.5
+_now_cache = (float('-inf'), None)
+
+# Non-ISO formats accepted by safe_datetime_parse (ISO strings use fromisoformat)
+_DATETIME_FORMATS = (
+    '%Y-%m-%d %H:%M:%S.%f',
+    '%Y-%m-%d %H:%M:%S',
+    '%d/%m/%Y %H:%M:%S',
+    '%d/%m/%Y',
+    '%m/%d/%Y %H:%M:%S',
+    '%m/%d/%Y',
+    '%Y-%m-%dT%H:%M:%S.%f',
+    '%Y-%m-%dT%H:%M:%S',
+    '%Y-%m-%d',
+)
 
 
 def safe_datetime_parse(value):
@@ -33,24 +68,38 @@ def safe_datetime_parse(value):
         return value
     
     if isinstance(value, str):
-        # Try common datetime formats
-        formats = [
-            '%Y-%m-%dT%H:%M:%S.%f',
-            '%Y-%m-%dT%H:%M:%S',
-            '%Y-%m-%d %H:%M:%S.%f',
-            '%Y-%m-%d %H:%M:%S',
-            '%Y-%m-%d',
-            '%d/%m/%Y %H:%M:%S',
-            '%d/%m/%Y',
-            '%m/%d/%Y %H:%M:%S',
-            '%m/%d/%Y'
-        ]
+        return _parse_datetime_str(value)
+    
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_datetime_str(value):
+    """
+    Parse a datetime string (memoized - repeated timestamps are common).
+    
+    Must depend only on `value`: results are cached, so any shared state
+    here would pin whichever answer was computed first.
+    
+    Args:
+        value: Datetime string
         
-        for fmt in formats:
-            try:
-                return datetime.strptime(value, fmt)
-            except ValueError:
-                continue
+    Returns:
+        datetime object or None if no known format matches
+    """
+    # PERFORMANCE: C-accelerated ISO parsing handles the common case
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        pass
+    
+    # Fall back to the other known formats in fixed order (day-first before
+    # month-first), so an ambiguous date always parses the same way
+    for fmt in _DATETIME_FORMATS:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
     
     return None
 
@@ -74,7 +123,7 @@ def convert_to_british_time(dt):
     try:
         # If datetime is naive (no timezone), assume it's UTC
         if dt.tzinfo is None:
-            dt = pytz.UTC.localize(dt)
+            dt = dt.replace(tzinfo=UTC)
         
         # Convert to British timezone
         return dt.astimezone(BRITISH_TZ)
@@ -93,6 +142,11 @@ def safe_date_format(value, format_str="%b %d, %I:%M %p"):
     Returns:
         Formatted date string in British time or empty string if formatting fails
     """
+    # PERFORMANCE: datetime values straight from MongoDB skip parsing entirely
+    # (convert_to_british_time already guards its own failures)
+    if isinstance(value, datetime):
+        return convert_to_british_time(value).strftime(format_str)
+    
     try:
         dt = safe_datetime_parse(value)
         if dt:
@@ -106,6 +160,11 @@ def safe_date_format(value, format_str="%b %d, %I:%M %p"):
         return ""
 
 
+def _british_midnight_ts(day):
+    """Return the start of a British calendar day as epoch seconds."""
+    return datetime.combine(day, time.min, tzinfo=BRITISH_TZ).timestamp()
+
+
 def group_tickets_by_date(tickets):
     """
     Group tickets by date categories (Today, Yesterday, This Week, etc.) in British timezone.
@@ -122,46 +181,64 @@ def group_tickets_by_date(tickets):
     # Get current time in British timezone
     now_british = datetime.now(BRITISH_TZ)
     today = now_british.date()
-    yesterday = today - timedelta(days=1)
-    week_ago = today - timedelta(days=7)
-    month_ago = today - timedelta(days=30)
-    
-    groups = {
-        'Today': [],
-        'Yesterday': [],
-        'This Week': [],
-        'This Month': [],
-        'Older': []
-    }
+    
+    # PERFORMANCE: Compute British-midnight boundaries once per call as epoch
+    # seconds and compare each ticket's timestamp against them - no per-ticket
+    # timezone conversion or date() objects
+    tomorrow_ts = _british_midnight_ts(today + timedelta(days=1))
+    today_ts = _british_midnight_ts(today)
+    yesterday_ts = _british_midnight_ts(today - timedelta(days=1))
+    week_ts = _british_midnight_ts(today - timedelta(days=6))
+    month_ts = _british_midnight_ts(today - timedelta(days=29))
+    
+    today_list = []
+    yesterday_list = []
+    week_list = []
+    month_list = []
+    older_list = []
     
     for ticket in tickets:
         created_at = ticket.get('created_at')
         dt = safe_datetime_parse(created_at)
         
         if not dt:
-            groups['Older'].append(ticket)
+            older_list.append(ticket)
             continue
         
-        # Convert to British timezone before comparing dates
-        british_dt = convert_to_british_time(dt)
-        if british_dt:
-            ticket_date = british_dt.date()
-        else:
-            ticket_date = dt.date()
+        # Naive datetimes are stored as UTC
+        ts = dt.timestamp() if dt.tzinfo else (dt - _EPOCH).total_seconds()
         
-        if ticket_date == today:
-            groups['Today'].append(ticket)
-        elif ticket_date == yesterday:
-            groups['Yesterday'].append(ticket)
-        elif ticket_date > week_ago:
-            groups['This Week'].append(ticket)
-        elif ticket_date > month_ago:
-            groups['This Month'].append(ticket)
+        if today_ts <= ts < tomorrow_ts:
+            today_list.append(ticket)
+        elif yesterday_ts <= ts < today_ts:
+            yesterday_list.append(ticket)
+        elif ts >= week_ts:
+            week_list.append(ticket)
+        elif ts >= month_ts:
+            month_list.append(ticket)
         else:
-            groups['Older'].append(ticket)
+            older_list.append(ticket)
     
-    # Remove empty groups
-    return {k: v for k, v in groups.items() if v}
+    # Build result in display order, skipping empty groups
+    groups = {}
+    for name, group in (('Today', today_list), ('Yesterday', yesterday_list),
+                        ('This Week', week_list), ('This Month', month_list),
+                        ('Older', older_list)):
+        if group:
+            groups[name] = group
+    return groups
+
+
+def _british_now():
+    """Current British time, reused for up to _NOW_CACHE_TTL seconds."""
+    global _now_cache
+    stamp = monotonic()
+    cached_stamp, cached_now = _now_cache
+    if stamp - cached_stamp > _NOW_CACHE_TTL:
+        cached_now = datetime.now(BRITISH_TZ)
+        # Single assignment - other threads never see a half-updated pair
+        _now_cache = (stamp, cached_now)
+    return cached_now
 
 
 def get_relative_time(dt):
@@ -182,7 +259,7 @@ def get_relative_time(dt):
         return "Unknown"
     
     # Convert both times to British timezone for accurate comparison
-    now_british = datetime.now(BRITISH_TZ)
+    now_british = _british_now()
     parsed_british = convert_to_british_time(parsed)
     
     if parsed_british:
@@ -192,20 +269,9 @@ def get_relative_time(dt):
     
     seconds = diff.total_seconds()
     
-    if seconds < 60:
+    index = bisect_right(_RELATIVE_THRESHOLDS, seconds)
+    if index == 0:
         return "Just now"
-    elif seconds < 3600:
-        minutes = int(seconds / 60)
-        return f"{minutes} minute{'s' if minutes != 1 else ''} ago"
-    elif seconds < 86400:
-        hours = int(seconds / 3600)
-        return f"{hours} hour{'s' if hours != 1 else ''} ago"
-    elif seconds < 604800:
-        days = int(seconds / 86400)
-        return f"{days} day{'s' if days != 1 else ''} ago"
-    elif seconds < 2592000:
-        weeks = int(seconds / 604800)
-        return f"{weeks} week{'s' if weeks != 1 else ''} ago"
-    else:
-        months = int(seconds / 2592000)
-        return f"{months} month{'s' if months != 1 else ''} ago"
+    divisor, unit = _RELATIVE_UNITS[index - 1]
+    count = int(seconds / divisor)
+    return f"{count} {unit}{'s' if count != 1 else ''} ago"
@@ -15,11 +15,40 @@ import os
 import re
 import base64
 import mimetypes
+import time
 from datetime import datetime
+from functools import lru_cache
+
+# PERFORMANCE: pybase64 (SIMD base64) is a drop-in replacement for the
+# stdlib codec when installed
+try:
+    import pybase64 as _b64
+except ImportError:
+    _b64 = base64
 
 
 # Allowed file extensions for uploads
-ALLOWED_EXTENSIONS = {'pdf', 'doc', 'docx', 'jpg', 'jpeg', 'png', 'txt', 'csv'}
+ALLOWED_EXTENSIONS = frozenset({'pdf', 'doc', 'docx', 'jpg', 'jpeg', 'png', 'txt', 'csv'})
+
+
+# Comprehensive warranty keywords including common misspellings
+WARRANTY_KEYWORDS = (
+    'warranty', 'guarantee', 'warrantee', 'warrenty', 'guarante', 'garentee',
+    'extended', 'protection', 'coverage', 'service_plan', 'service_contract',
+    'maintenance_agreement', 'care_plan', 'support_plan', 'repair_coverage',
+    'product_protection', 'extended_service', 'service_warranty', 
+    'manufacturer_warranty', 'factory_warranty', 'vehicle_warranty',
+    'bumper_to_bumper', 'powertrain', 'drivetrain', 'comprehensive_coverage',
+    'dpf', 'diesel', 'emission', 'claim', 'form', 'customer',
+    'repair', 'service', 'defect', 'malfunction', 'issue', 'fault',
+    'warranty_form', 'warranty_claim', 'claim_form', 'service_form'
+)
+
+# PERFORMANCE: One compiled alternation instead of a substring check per keyword,
+# matched on encoded bytes so lower-casing is a plain ASCII pass
+_WARRANTY_RE = re.compile(b'|'.join(
+    re.escape(k.encode('ascii')) for k in sorted(WARRANTY_KEYWORDS, key=len, reverse=True)
+))
 
 
 def allowed_file(filename):
@@ -32,8 +61,11 @@ def allowed_file(filename):
     Returns:
         bool: True if file extension is allowed
     """
-    return '.' in filename and \
-           filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    _, dot, extension = filename.rpartition('.')
+    return bool(dot) and extension.lower() in ALLOWED_EXTENSIONS
+
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
 
 
 def format_file_size(size_bytes):
@@ -49,12 +81,9 @@ def format_file_size(size_bytes):
     if not size_bytes:
         return "0 B"
     
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if abs(size_bytes) < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    
-    return f"{size_bytes:.1f} PB"
+    # Unit index straight from the bit length (each unit is 2**10 larger)
+    index = min(max((int(abs(size_bytes)).bit_length() - 1) // 10, 0), 5)
+    return f"{size_bytes / (1 << (10 * index)):.1f} {_SIZE_UNITS[index]}"
 
 
 def get_mime_type(filename):
@@ -70,10 +99,198 @@ def get_mime_type(filename):
     if not filename:
         return 'application/octet-stream'
     
-    mime_type, _ = mimetypes.guess_type(filename)
+    _, dot, extension = filename.rpartition('.')
+    if not dot:
+        return 'application/octet-stream'
+    extension = extension.lower()
+    return _EXT_MIME.get(extension) or _mime_for_ext(extension)
+
+
+@lru_cache(maxsize=256)
+def _mime_for_ext(extension):
+    """MIME type for a lowercased extension (memoized - the set is small)."""
+    mime_type, _ = mimetypes.guess_type(f'file.{extension}')
     return mime_type or 'application/octet-stream'
 
 
+# File type details (icon, color, label, MIME type, capabilities) by extension.
+# Shared, read-only - get_enhanced_file_type_info returns copies.
+_FILE_TYPE_MAPPING = {
+    # Document types
+    'pdf': {
+        'icon': 'fas fa-file-pdf', 
+        'color': 'text-red-600', 
+        'type': 'PDF Document',
+        'mime': 'application/pdf',
+        'viewable': True,
+        'category': 'document'
+    },
+    'doc': {
+        'icon': 'fas fa-file-word', 
+        'color': 'text-blue-600', 
+        'type': 'Word Document',
+        'mime': 'application/msword',
+        'viewable': False,
+        'category': 'document'
+    },
+    'docx': {
+        'icon': 'fas fa-file-word', 
+        'color': 'text-blue-600', 
+        'type': 'Word Document',
+        'mime': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+        'viewable': False,
+        'category': 'document'
+    },
+    'xls': {
+        'icon': 'fas fa-file-excel', 
+        'color': 'text-green-600', 
+        'type': 'Excel Spreadsheet',
+        'mime': 'application/vnd.ms-excel',
+        'viewable': False,
+        'category': 'spreadsheet'
+    },
+    'xlsx': {
+        'icon': 'fas fa-file-excel', 
+        'color': 'text-green-600', 
+        'type': 'Excel Spreadsheet',
+        'mime': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+        'viewable': False,
+        'category': 'spreadsheet'
+    },
+    'ppt': {
+        'icon': 'fas fa-file-powerpoint', 
+        'color': 'text-orange-600', 
+        'type': 'PowerPoint Presentation',
+        'mime': 'application/vnd.ms-powerpoint',
+        'viewable': False,
+        'category': 'presentation'
+    },
+    'pptx': {
+        'icon': 'fas fa-file-powerpoint', 
+        'color': 'text-orange-600', 
+        'type': 'PowerPoint Presentation',
+        'mime': 'application/vnd.openxmlformats-officedocument.presentationml.presentation',
+        'viewable': False,
+        'category': 'presentation'
+    },
+    # Image types
+    'jpg': {
+        'icon': 'fas fa-file-image', 
+        'color': 'text-purple-600', 
+        'type': 'JPEG Image',
+        'mime': 'image/jpeg',
+        'viewable': True,
+        'category': 'image'
+    },
+    'jpeg': {
+        'icon': 'fas fa-file-image', 
+        'color': 'text-purple-600', 
+        'type': 'JPEG Image',
+        'mime': 'image/jpeg',
+        'viewable': True,
+        'category': 'image'
+    },
+    'png': {
+        'icon': 'fas fa-file-image', 
+        'color': 'text-purple-600', 
+        'type': 'PNG Image',
+        'mime': 'image/png',
+        'viewable': True,
+        'category': 'image'
+    },
+    'gif': {
+        'icon': 'fas fa-file-image', 
+        'color': 'text-purple-600', 
+        'type': 'GIF Image',
+        'mime': 'image/gif',
+        'viewable': True,
+        'category': 'image'
+    },
+    'webp': {
+        'icon': 'fas fa-file-image', 
+        'color': 'text-purple-600', 
+        'type': 'WebP Image',
+        'mime': 'image/webp',
+        'viewable': True,
+        'category': 'image'
+    },
+    # Archive types
+    'zip': {
+        'icon': 'fas fa-file-archive', 
+        'color': 'text-yellow-600', 
+        'type': 'ZIP Archive',
+        'mime': 'application/zip',
+        'viewable': False,
+        'category': 'archive'
+    },
+    'rar': {
+        'icon': 'fas fa-file-archive', 
+        'color': 'text-yellow-600', 
+        'type': 'RAR Archive',
+        'mime': 'application/vnd.rar',
+        'viewable': False,
+        'category': 'archive'
+    },
+    '7z': {
+        'icon': 'fas fa-file-archive', 
+        'color': 'text-yellow-600', 
+        'type': '7-Zip Archive',
+        'mime': 'application/x-7z-compressed',
+        'viewable': False,
+        'category': 'archive'
+    },
+    # Text types
+    'txt': {
+        'icon': 'fas fa-file-alt', 
+        'color': 'text-gray-600', 
+        'type': 'Text File',
+        'mime': 'text/plain',
+        'viewable': True,
+        'category': 'text'
+    },
+    'csv': {
+        'icon': 'fas fa-file-csv', 
+        'color': 'text-green-600', 
+        'type': 'CSV File',
+        'mime': 'text/csv',
+        'viewable': True,
+        'category': 'data'
+    },
+    'json': {
+        'icon': 'fas fa-file-code', 
+        'color': 'text-indigo-600', 
+        'type': 'JSON File',
+        'mime': 'application/json',
+        'viewable': True,
+        'category': 'data'
+    },
+    'xml': {
+        'icon': 'fas fa-file-code', 
+        'color': 'text-indigo-600', 
+        'type': 'XML File',
+        'mime': 'application/xml',
+        'viewable': True,
+        'category': 'data'
+    }
+}
+
+_DEFAULT_FILE_INFO = {
+    'icon': 'fas fa-file', 
+    'color': 'text-gray-600', 
+    'type': 'File',
+    'mime': 'application/octet-stream',
+    'viewable': False,
+    'category': 'unknown'
+}
+
+# PERFORMANCE: Static MIME lookup for known extensions; mimetypes is only
+# consulted for anything outside _FILE_TYPE_MAPPING
+_EXT_MIME = {ext: info['mime'] for ext, info in _FILE_TYPE_MAPPING.items()}
+
+# Upper-case display form of every known extension, built once
+_EXT_UPPER = {ext: ext.upper() for ext in _FILE_TYPE_MAPPING}
+
+
 def get_enhanced_file_type_info(filename, file_size=0):
     """
     Advanced file type detection with comprehensive MIME type mapping.
@@ -86,182 +303,24 @@ def get_enhanced_file_type_info(filename, file_size=0):
     Returns:
         dict: File information with icon, color, type, mime, viewable, category
     """
-    extension = filename.split('.').pop().lower() if filename else ''
+    # Extension = text after the last dot (whole name if there is none)
+    extension = filename.rpartition('.')[2].lower() if filename else ''
     
-    file_type_mapping = {
-        # Document types
-        'pdf': {
-            'icon': 'fas fa-file-pdf', 
-            'color': 'text-red-600', 
-            'type': 'PDF Document',
-            'mime': 'application/pdf',
-            'viewable': True,
-            'category': 'document'
-        },
-        'doc': {
-            'icon': 'fas fa-file-word', 
-            'color': 'text-blue-600', 
-            'type': 'Word Document',
-            'mime': 'application/msword',
-            'viewable': False,
-            'category': 'document'
-        },
-        'docx': {
-            'icon': 'fas fa-file-word', 
-            'color': 'text-blue-600', 
-            'type': 'Word Document',
-            'mime': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-            'viewable': False,
-            'category': 'document'
-        },
-        'xls': {
-            'icon': 'fas fa-file-excel', 
-            'color': 'text-green-600', 
-            'type': 'Excel Spreadsheet',
-            'mime': 'application/vnd.ms-excel',
-            'viewable': False,
-            'category': 'spreadsheet'
-        },
-        'xlsx': {
-            'icon': 'fas fa-file-excel', 
-            'color': 'text-green-600', 
-            'type': 'Excel Spreadsheet',
-            'mime': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-            'viewable': False,
-            'category': 'spreadsheet'
-        },
-        'ppt': {
-            'icon': 'fas fa-file-powerpoint', 
-            'color': 'text-orange-600', 
-            'type': 'PowerPoint Presentation',
-            'mime': 'application/vnd.ms-powerpoint',
-            'viewable': False,
-            'category': 'presentation'
-        },
-        'pptx': {
-            'icon': 'fas fa-file-powerpoint', 
-            'color': 'text-orange-600', 
-            'type': 'PowerPoint Presentation',
-            'mime': 'application/vnd.openxmlformats-officedocument.presentationml.presentation',
-            'viewable': False,
-            'category': 'presentation'
-        },
-        # Image types
-        'jpg': {
-            'icon': 'fas fa-file-image', 
-            'color': 'text-purple-600', 
-            'type': 'JPEG Image',
-            'mime': 'image/jpeg',
-            'viewable': True,
-            'category': 'image'
-        },
-        'jpeg': {
-            'icon': 'fas fa-file-image', 
-            'color': 'text-purple-600', 
-            'type': 'JPEG Image',
-            'mime': 'image/jpeg',
-            'viewable': True,
-            'category': 'image'
-        },
-        'png': {
-            'icon': 'fas fa-file-image', 
-            'color': 'text-purple-600', 
-            'type': 'PNG Image',
-            'mime': 'image/png',
-            'viewable': True,
-            'category': 'image'
-        },
-        'gif': {
-            'icon': 'fas fa-file-image', 
-            'color': 'text-purple-600', 
-            'type': 'GIF Image',
-            'mime': 'image/gif',
-            'viewable': True,
-            'category': 'image'
-        },
-        'webp': {
-            'icon': 'fas fa-file-image', 
-            'color': 'text-purple-600', 
-            'type': 'WebP Image',
-            'mime': 'image/webp',
-            'viewable': True,
-            'category': 'image'
-        },
-        # Archive types
-        'zip': {
-            'icon': 'fas fa-file-archive', 
-            'color': 'text-yellow-600', 
-            'type': 'ZIP Archive',
-            'mime': 'application/zip',
-            'viewable': False,
-            'category': 'archive'
-        },
-        'rar': {
-            'icon': 'fas fa-file-archive', 
-            'color': 'text-yellow-600', 
-            'type': 'RAR Archive',
-            'mime': 'application/vnd.rar',
-            'viewable': False,
-            'category': 'archive'
-        },
-        '7z': {
-            'icon': 'fas fa-file-archive', 
-            'color': 'text-yellow-600', 
-            'type': '7-Zip Archive',
-            'mime': 'application/x-7z-compressed',
-            'viewable': False,
-            'category': 'archive'
-        },
-        # Text types
-        'txt': {
-            'icon': 'fas fa-file-alt', 
-            'color': 'text-gray-600', 
-            'type': 'Text File',
-            'mime': 'text/plain',
-            'viewable': True,
-            'category': 'text'
-        },
-        'csv': {
-            'icon': 'fas fa-file-csv', 
-            'color': 'text-green-600', 
-            'type': 'CSV File',
-            'mime': 'text/csv',
-            'viewable': True,
-            'category': 'data'
-        },
-        'json': {
-            'icon': 'fas fa-file-code', 
-            'color': 'text-indigo-600', 
-            'type': 'JSON File',
-            'mime': 'application/json',
-            'viewable': True,
-            'category': 'data'
-        },
-        'xml': {
-            'icon': 'fas fa-file-code', 
-            'color': 'text-indigo-600', 
-            'type': 'XML File',
-            'mime': 'application/xml',
-            'viewable': True,
-            'category': 'data'
-        }
+    # Copy the cached per-extension entry and add file size information
+    return {
+        **_file_info_for_ext(extension),
+        'size': file_size,
+        'size_formatted': format_file_size(file_size),
+    }
+
+
+@lru_cache(maxsize=256)
+def _file_info_for_ext(extension):
+    """Constant part of the file type info for an extension (memoized, read-only)."""
+    return {
+        **_FILE_TYPE_MAPPING.get(extension, _DEFAULT_FILE_INFO),
+        'extension': _EXT_UPPER.get(extension) or extension.upper(),
     }
-    
-    file_info = file_type_mapping.get(extension, {
-        'icon': 'fas fa-file', 
-        'color': 'text-gray-600', 
-        'type': 'File',
-        'mime': 'application/octet-stream',
-        'viewable': False,
-        'category': 'unknown'
-    })
-    
-    # Add file size information
-    file_info['size'] = file_size
-    file_info['size_formatted'] = format_file_size(file_size)
-    file_info['extension'] = extension.upper()
-    
-    return file_info
 
 
 def detect_warranty_form(filename, file_data=None):
@@ -279,25 +338,9 @@ def detect_warranty_form(filename, file_data=None):
     if not filename:
         return False
     
-    # Comprehensive warranty keywords including common misspellings
-    warranty_keywords = [
-        'warranty', 'guarantee', 'warrantee', 'warrenty', 'guarante', 'garentee',
-        'extended', 'protection', 'coverage', 'service_plan', 'service_contract',
-        'maintenance_agreement', 'care_plan', 'support_plan', 'repair_coverage',
-        'product_protection', 'extended_service', 'service_warranty', 
-        'manufacturer_warranty', 'factory_warranty', 'vehicle_warranty',
-        'bumper_to_bumper', 'powertrain', 'drivetrain', 'comprehensive_coverage',
-        'dpf', 'diesel', 'emission', 'claim', 'form', 'customer',
-        'repair', 'service', 'defect', 'malfunction', 'issue', 'fault',
-        'warranty_form', 'warranty_claim', 'claim_form', 'service_form'
-    ]
-    
-    filename_lower = filename.lower()
-    
-    # Check filename for warranty keywords
-    for keyword in warranty_keywords:
-        if keyword in filename_lower:
-            return True
+    # Check filename for warranty keywords (single regex pass over the bytes)
+    if _WARRANTY_RE.search(filename.encode('utf-8', 'ignore').lower()):
+        return True
     
     # Future enhancement: Content-based analysis
     if file_data:
@@ -307,6 +350,11 @@ def detect_warranty_form(filename, file_data=None):
     return False
 
 
+# Characters not allowed in stored attachment filenames
+_UNSAFE_FN_RE = re.compile(r"[^\w\-.]", re.ASCII)
+_SAFE_FN_RE = re.compile(r"[\w\-.]+", re.ASCII)
+
+
 def safe_attachment_filename(name, max_len=200):
     """
     Sanitize attachment filename for filesystem: no path traversal, no nulls.
@@ -315,8 +363,11 @@ def safe_attachment_filename(name, max_len=200):
         return "attachment"
     # Remove path components and null bytes
     name = os.path.basename(name).replace("\x00", "").strip()
+    # PERFORMANCE: Most names are already clean - skip the substitution
+    if _SAFE_FN_RE.fullmatch(name):
+        return name[:max_len]
     # Allow only alphanumeric, dash, underscore, dot
-    name = re.sub(r"[^\w\-.]", "_", name, flags=re.ASCII)
+    name = _UNSAFE_FN_RE.sub("_", name)
     return name[:max_len] if name else "attachment"
 
 
@@ -328,26 +379,129 @@ def extract_attachment_bytes(att):
     """
     if not att or not isinstance(att, dict):
         return None, "attachment not a dict"
-    raw = att.get("data") or att.get("fileData") or att.get("content")
-    if raw is None and isinstance(att.get("binary"), dict):
-        raw = att["binary"].get("data")
+    raw = _attachment_payload(att)
     if raw is None:
         return None, "no data/fileData/content/binary.data"
     if isinstance(raw, bytes):
         return raw, None
     if isinstance(raw, str):
         try:
-            if raw.startswith('data:'):
-                comma_idx = raw.find(',')
-                if comma_idx > -1:
-                    raw = raw[comma_idx + 1:]
             # validate=False handles padding issues more gracefully
-            return base64.b64decode(raw, validate=False), None
+            return _b64.b64decode(raw, validate=False), None
         except Exception as e:
             return None, str(e)
     return None, "unsupported data type"
 
 
+_PAYLOAD_KEYS = ("data", "fileData", "content")
+
+
+def _attachment_payload(att):
+    """
+    Raw payload of an attachment dict: bytes, or base64 text with any
+    data-URI prefix removed. Returns None if no payload field is set.
+    """
+    # First non-empty payload field wins; binary.data is the last resort
+    for key in _PAYLOAD_KEYS:
+        raw = att.get(key)
+        if raw:
+            break
+    else:
+        binary = att.get("binary")
+        raw = binary.get("data") if isinstance(binary, dict) else None
+    if isinstance(raw, str) and raw.startswith('data:'):
+        comma_idx = raw.find(',')
+        if comma_idx > -1:
+            raw = raw[comma_idx + 1:]
+    return raw
+
+
+# Canonical base64 text (no whitespace, padding only at the end) - safe to
+# decode in independent 4-character-aligned chunks
+_CLEAN_B64_RE = re.compile(r"[A-Za-z0-9+/]*={0,2}")
+
+
+def stream_decode_b64_to_fd(b64_str, fd, chunk_size=64 * 1024):
+    """
+    Decode clean base64 text into a file descriptor chunk by chunk.
+    
+    PERFORMANCE: Peak memory is one chunk instead of the whole decoded file.
+    
+    Args:
+        b64_str: Base64 text matching _CLEAN_B64_RE (length a multiple of 4)
+        fd: Open file descriptor to write to
+        chunk_size: Decoded bytes per chunk (rounded down to a multiple of 3)
+        
+    Returns:
+        int: Number of decoded bytes written
+    """
+    step = max(chunk_size // 3, 1) * 4
+    total = 0
+    for start in range(0, len(b64_str), step):
+        data = _b64.b64decode(b64_str[start:start + step])
+        _write_all(fd, data)
+        total += len(data)
+    return total
+
+
+# Fixed upload roots (replies, claim_docs) already created by this process.
+# Per-ticket directories are not cached - one entry per ticket would grow for
+# the life of the worker; ticket saves create their directory once per call.
+_ensured_dirs = set()
+
+
+def _ensure_dir(path):
+    """Create a fixed upload root once per process; later calls skip the makedirs stat."""
+    if path not in _ensured_dirs:
+        os.makedirs(path, exist_ok=True)
+        _ensured_dirs.add(path)
+
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+
+def _open_for_write(file_path):
+    """Open a file descriptor for writing, recreating a vanished upload directory once."""
+    try:
+        return os.open(file_path, _WRITE_FLAGS, 0o644)
+    except FileNotFoundError:
+        # Directory removed since it was created (or cached by _ensure_dir) - recreate once
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        return os.open(file_path, _WRITE_FLAGS, 0o644)
+
+
+def _preallocate(fd, size):
+    """Reserve file space up front where the platform/filesystem supports it."""
+    if size and hasattr(os, 'posix_fallocate'):
+        try:
+            os.posix_fallocate(fd, 0, size)
+        except OSError:
+            pass  # Not supported by this filesystem
+
+
+def _write_all(fd, data):
+    """os.write until all of data is written (handles short writes)."""
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def _write_bytes(file_path, data_bytes):
+    """
+    Write in-memory bytes straight to a file descriptor.
+    
+    PERFORMANCE: Skips the buffered-IO layer (the data is already in memory)
+    and preallocates the file where supported to avoid fragmentation.
+    """
+    fd = _open_for_write(file_path)
+    try:
+        _preallocate(fd, len(data_bytes))
+        _write_all(fd, data_bytes)
+    finally:
+        os.close(fd)
+
+
 def save_ticket_attachment_to_disk(ticket_id, attachment_dict, index, upload_root):
     """
     Persist one ticket attachment to disk and return metadata dict for MongoDB.
@@ -358,6 +512,50 @@ def save_ticket_attachment_to_disk(ticket_id, attachment_dict, index, upload_roo
     (serverless / ephemeral disk) can still serve attachments after deploy.
     On failure returns None and the caller can keep original or drop.
     """
+    ticket_dir = _make_ticket_dir(upload_root, ticket_id)
+    if ticket_dir is None:
+        return None
+    return _save_ticket_attachment(
+        ticket_dir, attachment_dict, index, time.time_ns() // 1_000_000_000, datetime.now()
+    )
+
+
+def save_ticket_attachments_to_disk(ticket_id, attachments, upload_root):
+    """
+    Persist all attachments of a ticket to disk in one pass.
+    Same storage layout and metadata as save_ticket_attachment_to_disk, but the
+    ticket directory is created, and the timestamp and upload time resolved,
+    once for the batch.
+    Returns a list aligned with `attachments`: metadata dict, or None on failure.
+    """
+    if not attachments:
+        return []
+    ticket_dir = _make_ticket_dir(upload_root, ticket_id)
+    if ticket_dir is None:
+        return [None] * len(attachments)
+    ts = time.time_ns() // 1_000_000_000
+    uploaded_at = datetime.now()
+    return [
+        _save_ticket_attachment(ticket_dir, att, index, ts, uploaded_at)
+        for index, att in enumerate(attachments)
+    ]
+
+
+def _make_ticket_dir(upload_root, ticket_id):
+    """Create upload_root/tickets/<ticket_id> and return its path, or None on failure."""
+    ticket_dir = os.path.join(upload_root, "tickets", str(ticket_id))
+    try:
+        os.makedirs(ticket_dir, exist_ok=True)
+    except OSError:
+        return None
+    return ticket_dir
+
+
+def _save_ticket_attachment(ticket_dir, attachment_dict, index, ts, uploaded_at):
+    """
+    Write one attachment into ticket_dir (already created by the caller);
+    see save_ticket_attachment_to_disk.
+    """
     if not attachment_dict or not isinstance(attachment_dict, dict):
         return None
     fn = (
@@ -367,24 +565,38 @@ def save_ticket_attachment_to_disk(ticket_id, attachment_dict, index, upload_roo
         or "attachment"
     )
     fn = safe_attachment_filename(fn)
-    data_bytes, err = extract_attachment_bytes(attachment_dict)
-    if data_bytes is None:
-        return None
+    
+    # PERFORMANCE: Clean base64 text is decoded straight into the file in chunks
+    # and reused as-is for MongoDB - no full decoded copy, no re-encode
+    raw = _attachment_payload(attachment_dict)
+    streamable = (
+        isinstance(raw, str) and raw and len(raw) % 4 == 0
+        and _CLEAN_B64_RE.fullmatch(raw) is not None
+    )
+    if not streamable:
+        data_bytes, err = extract_attachment_bytes(attachment_dict)
+        if data_bytes is None:
+            return None
     try:
-        ticket_dir = os.path.join(upload_root, "tickets", str(ticket_id))
-        os.makedirs(ticket_dir, exist_ok=True)
-        ts = int(datetime.now().timestamp())
         base_name, ext = os.path.splitext(fn)
         if not ext and len(base_name) > 32:
             base_name = base_name[:32]
         unique_name = f"{base_name}_{index}_{ts}{ext}"
         file_path = os.path.join(ticket_dir, unique_name)
-        with open(file_path, "wb") as f:
-            f.write(data_bytes)
-        size = len(data_bytes)
+        if streamable:
+            fd = _open_for_write(file_path)
+            try:
+                _preallocate(fd, len(raw) // 4 * 3 - raw.count('=', -2))
+                size = stream_decode_b64_to_fd(raw, fd)
+            finally:
+                os.close(fd)
+            b64_data = raw
+        else:
+            _write_bytes(file_path, data_bytes)
+            size = len(data_bytes)
+            # Store base64 data in MongoDB so Vercel ephemeral disk doesn't break previews
+            b64_data = _b64.b64encode(data_bytes).decode('utf-8')
         mime_type = get_mime_type(fn)
-        # Store base64 data in MongoDB so Vercel ephemeral disk doesn't break previews
-        b64_data = base64.b64encode(data_bytes).decode('utf-8')
         return {
             "filename": fn,
             "fileName": fn,
@@ -393,7 +605,7 @@ def save_ticket_attachment_to_disk(ticket_id, attachment_dict, index, upload_roo
             "fileData": b64_data,
             "mime_type": mime_type,
             "size": size,
-            "uploaded_at": datetime.now(),
+            "uploaded_at": uploaded_at,
         }
     except Exception:
         return None
@@ -411,16 +623,19 @@ def save_attachment_bytes_to_disk(upload_root, subdir, unique_prefix, filename,
     fn = safe_attachment_filename(filename)
     try:
         dir_path = os.path.join(upload_root, subdir)
-        os.makedirs(dir_path, exist_ok=True)
-        ts = int(datetime.now().timestamp())
+        if "/" in subdir:
+            # Per-ticket subdirectory (e.g. tickets/<id>) - not cached
+            os.makedirs(dir_path, exist_ok=True)
+        else:
+            _ensure_dir(dir_path)
+        ts = time.time_ns() // 1_000_000_000
         base_name, ext = os.path.splitext(fn)
         if not ext and len(base_name) > 32:
             base_name = base_name[:32]
         unique_name = f"{unique_prefix}_{ts}_{base_name}{ext}"
         file_path = os.path.join(dir_path, unique_name)
-        with open(file_path, "wb") as f:
-            f.write(data_bytes)
-        b64_data = base64.b64encode(data_bytes).decode('utf-8')
+        _write_bytes(file_path, data_bytes)
+        b64_data = _b64.b64encode(data_bytes).decode('utf-8')
         return {
             "filename": fn,
             "file_path": file_path,
@@ -11,6 +11,8 @@ Author: AutoAssistGroup Development Team
 import os
 from utils.date_utils import safe_date_format
 
+_basename = os.path.basename
+
 
 def get_basename(path):
     """
@@ -20,7 +22,8 @@ def get_basename(path):
     """
     if not path:
         return ""
-    return os.path.basename(str(path))
+    # Template values are almost always str already - skip the str() call
+    return _basename(path if isinstance(path, str) else str(path))
 
 
 def format_datetime(value, format_str="%b %d, %I:%M %p"):
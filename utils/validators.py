@@ -10,7 +10,15 @@ Author: AutoAssistGroup Development Team
 """
 
 import re
-import html
+
+from markupsafe import Markup, escape
+
+
+# Precompiled patterns
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_ANGLE_RE = re.compile(r'<([^>]+)>')
+# Separators in the local part of an address that become spaces in a name
+_NAME_SEP_TABLE = str.maketrans('._-', '   ')
 
 
 def sanitize_input(text):
@@ -21,11 +29,13 @@ def sanitize_input(text):
         text: Raw user input text
         
     Returns:
-        Escaped and stripped text safe for display
+        Markup: Escaped and stripped text safe for display. Jinja treats it
+        as already safe, so auto-escaping does not escape it a second time.
     """
     if not text:
-        return ""
-    return html.escape(str(text).strip())
+        return Markup("")
+    # markupsafe's C escape; str() drops any incoming Markup so input is always escaped
+    return escape(str(text).strip())
 
 
 def validate_email(email):
@@ -40,8 +50,7 @@ def validate_email(email):
     """
     if not email:
         return False
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    return _EMAIL_RE.match(email) is not None
 
 
 def validate_ticket_id(ticket_id):
@@ -54,10 +63,11 @@ def validate_ticket_id(ticket_id):
     Returns:
         bool: True if ticket ID format is valid
     """
-    if not ticket_id or len(str(ticket_id)) > 50:
+    if not ticket_id:
         return False
+    ticket_id = str(ticket_id)
     # No spaces allowed in ticket IDs
-    return str(ticket_id).replace(' ', '') == str(ticket_id)
+    return len(ticket_id) <= 50 and ' ' not in ticket_id
 
 
 def extract_email(raw_email):
@@ -77,13 +87,14 @@ def extract_email(raw_email):
     if not raw_email:
         return ""
     
+    raw_email = str(raw_email)
     # Try to extract email from "Name <email>" format
-    match = re.search(r'<([^>]+)>', str(raw_email))
+    match = _ANGLE_RE.search(raw_email)
     if match:
         return match.group(1).strip()
     
     # Otherwise return the original stripped
-    return str(raw_email).strip()
+    return raw_email.strip()
 
 
 def extract_name_from_email(email_address):
@@ -103,7 +114,6 @@ def extract_name_from_email(email_address):
         # Extract part before @
         name_part = email_address.split('@')[0]
         # Replace common separators with spaces and title case
-        name = name_part.replace('.', ' ').replace('_', ' ').replace('-', ' ')
-        return name.title()
+        return name_part.translate(_NAME_SEP_TABLE).title()
     except Exception:
         return "Unknown"